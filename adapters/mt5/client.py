@@ -41,6 +41,8 @@ class MT5Client:
 
         self.connection = MT5Connection(login, password, server)
         self._symbol_selected = False
+        self._cached_tick: Optional[Tick] = None
+        self._cached_tick_at: float = 0.0
 
     def connect(self) -> bool:
         if not self.connection.connect():
@@ -53,6 +55,23 @@ class MT5Client:
     def is_ready(self) -> bool:
         return self.connection.is_connected() and self._symbol_selected
 
+    async def __aenter__(self) -> "MT5Client":
+        """
+        Conecta al entrar en `async with` y garantiza disconnect() al salir.
+
+        Raises:
+            ConnectionError: Si no se pudo conectar o seleccionar el símbolo
+        """
+        if not self.connect():
+            self.disconnect()
+            raise ConnectionError(
+                f"No se pudo conectar a MT5 ({self.connection.server}, {self.symbol})"
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.disconnect()
+
     # ==========================================
     # Symbol Operations
     # ==========================================
@@ -73,6 +92,24 @@ class MT5Client:
         self.logger.error("No se pudo obtener tick", symbol=self.symbol)
         return None
 
+    def get_cached_tick(self, max_age_ms: float = 50.0) -> Optional[Tick]:
+        """
+        Último tick si tiene menos de max_age_ms; si no, pide uno nuevo.
+
+        Para lecturas de decisión (varias señales en el mismo scan) que no
+        necesitan un round-trip a MT5 cada una. Las órdenes siguen usando
+        get_tick() para precio fresco.
+        """
+        now = time.monotonic()
+        if self._cached_tick is not None and (now - self._cached_tick_at) * 1000.0 < max_age_ms:
+            return self._cached_tick
+
+        tick = self.get_tick()
+        if tick is not None:
+            self._cached_tick = tick
+            self._cached_tick_at = time.monotonic()
+        return tick
+
     def get_symbol_info(self) -> Optional[SymbolInfo]:
         try:
             native_info = mt5.symbol_info(self.symbol)
@@ -225,11 +262,12 @@ class MT5Client:
             Lista de posiciones (puede ser vacía, nunca None)
         """
         try:
-            all_positions = mt5.positions_get(symbol=self.symbol) or []
-            # Filtrar solo las del bot por MAGIC number
+            # MT5 filtra por símbolo en el terminal; positions_get no acepta
+            # magic, así que ese filtro se hace aquí.
+            magic = self.magic
             return [
-                p for p in all_positions
-                if int(getattr(p, "magic", 0) or 0) == self.magic
+                p for p in mt5.positions_get(symbol=self.symbol) or ()
+                if p.magic == magic
             ]
         except Exception as ex:
             self.logger.error("Error obteniendo todas las posiciones", error=str(ex))
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Tick:
     """Representa un tick de precio del mercado."""
     bid: float
@@ -15,7 +15,7 @@ class Tick:
     time_msc: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolInfo:
     """Información de un símbolo."""
     name: str
@@ -27,7 +27,7 @@ class SymbolInfo:
     visible: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class MT5Error:
     """Error retornado por MT5."""
     code: Optional[int]
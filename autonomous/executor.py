@@ -8,6 +8,11 @@ from infrastructure.logging import get_logger
 
 logger = get_logger()
 
+# Límites de drift (en precio) entre entry y precio actual; la config es
+# inmutable en runtime, así que se resuelven una vez al importar.
+_HARD_DRIFT_LIMIT = float(getattr(CFG, "HARD_DRIFT_LIMIT", 15.0))
+_SOFT_DRIFT_LIMIT = float(getattr(CFG, "SOFT_DRIFT_LIMIT", 3.0))
+
 _mt5_client: Optional[MT5Client] = None
 
 
@@ -31,7 +36,7 @@ def execute_signal_direct(
         logger.event("AUTONOMOUS_MT5_NOT_READY", msg_id=msg_id)
         return False
 
-    tick = mt5.get_tick()
+    tick = mt5.get_cached_tick()
     if not tick:
         logger.event("AUTONOMOUS_NO_TICK", msg_id=msg_id)
         return False
@@ -110,12 +115,10 @@ def _get_current_price(side: str, bid: float, ask: float) -> float:
 
 def _decide_execution_mode(side: str, entry: float, current: float) -> str:
     drift_pips = abs(entry - current)
-    hard_drift = float(getattr(CFG, "HARD_DRIFT_LIMIT", 15.0))
-    soft_drift = float(getattr(CFG, "SOFT_DRIFT_LIMIT", 3.0))
 
-    if drift_pips > hard_drift:
+    if drift_pips > _HARD_DRIFT_LIMIT:
         return "SKIP"
-    if drift_pips <= soft_drift:
+    if drift_pips <= _SOFT_DRIFT_LIMIT:
         return "MARKET"
     return "LIMIT"
 
@@ -156,7 +159,7 @@ def _execute_market_order(
         logger.event("ORDER_MARKET_FAILED", msg_id=msg_id, side=signal.side)
         return False
     except Exception as ex:
-        logger.error("ORDER_MARKET_ERROR", exc_info=True, msg_id=msg_id, error=str(ex))
+        logger.error("ORDER_MARKET_ERROR", exc_info=ex, msg_id=msg_id, error=str(ex))
         return False
 
 
@@ -192,5 +195,5 @@ def _execute_limit_order(
         logger.event("ORDER_LIMIT_FAILED", msg_id=msg_id, side=signal.side)
         return False
     except Exception as ex:
-        logger.error("ORDER_LIMIT_ERROR", exc_info=True, msg_id=msg_id, error=str(ex))
+        logger.error("ORDER_LIMIT_ERROR", exc_info=ex, msg_id=msg_id, error=str(ex))
         return False
\ No newline at end of file
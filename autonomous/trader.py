@@ -10,7 +10,7 @@ _tick_loop(): cada 100ms
     → Corre M1: MomentumStrategy
     → Detecta movimientos explosivos inmediatos
     → Entra a mercado sin esperar siguiente candle loop
-    → Heartbeat cada 5 min para confirmar que el loop está vivo
+    → Heartbeat solo ante cambios de estado (máx. 1h de silencio)
 """
 from __future__ import annotations
 
@@ -67,7 +67,7 @@ class AutonomousTrader:
         # Loop rápido: Momentum en M1
         self._momentum_symbol = str(CFG.SYMBOL)
         self._momentum_magic = int(CFG.MAGIC)
-        self._momentum_data = DataProvider(self._momentum_symbol)
+        self._momentum_data = DataProvider(self._momentum_symbol, "M1")
         self._momentum_strategy = MomentumStrategy(
             symbol=self._momentum_symbol,
             magic=self._momentum_magic,
@@ -82,15 +82,21 @@ class AutonomousTrader:
         # Heartbeat del tick loop
         self._tick_count: int = 0
         self._tick_errors: int = 0
+        self._tick_window_errors: int = 0
         self._tick_last_heartbeat: float = 0.0
-        self._tick_heartbeat_interval: float = 300.0  # heartbeat cada 5 min
+        self._tick_last_emit: float = 0.0
+        self._tick_last_health: tuple | None = None
+        self._tick_heartbeat_interval: float = 300.0   # chequeo cada 5 min
+        self._tick_heartbeat_max_silence: float = 3600.0  # emite al menos cada 1h
 
     async def run(self) -> None:
         """
         Arranca ambos loops de forma concurrente.
 
-        _candle_loop y _tick_loop corren como tasks paralelas.
-        Si uno falla, el otro continúa.
+        _candle_loop y _tick_loop corren dentro de un TaskGroup: cada loop
+        ya captura sus propios errores por iteración, así que solo una
+        cancelación (o un error fatal) los detiene, y en ese caso el
+        TaskGroup cancela y espera al otro antes de salir.
         """
         self.running = True
 
@@ -101,11 +107,13 @@ class AutonomousTrader:
             tick_interval_ms=int(self.tick_interval_s * 1000),
         )
 
-        candle_task = asyncio.create_task(self._candle_loop())
-        tick_task = asyncio.create_task(self._tick_loop())
-
-        # Esperar ambos (corren indefinidamente hasta self.running = False)
-        await asyncio.gather(candle_task, tick_task, return_exceptions=True)
+        # Corren indefinidamente hasta self.running = False o cancelación
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._candle_loop(), name="candle_loop")
+                tg.create_task(self._tick_loop(), name="tick_loop")
+        finally:
+            self.running = False
 
     async def _candle_loop(self) -> None:
         """
@@ -141,13 +149,14 @@ class AutonomousTrader:
         evalúa si hay momentum explosivo para entrar a mercado.
 
         Cooldown de 60s entre señales para evitar sobretrading.
-        Heartbeat cada 5 min para confirmar que el loop está vivo.
+        Heartbeat cada 5 min, emitido solo cuando cambia el estado
+        (errores, cooldown, último lado) o tras 1h sin emitir.
         """
         self.logger.event(
             "TICK_LOOP_STARTED",
             tick_interval_ms=int(self.tick_interval_s * 1000),
         )
-        self._tick_last_heartbeat = time.monotonic()
+        self._tick_last_heartbeat = self._tick_last_emit = time.monotonic()
 
         while self.running:
             try:
@@ -155,26 +164,42 @@ class AutonomousTrader:
                 self._tick_count += 1
             except Exception as ex:
                 self._tick_errors += 1
+                self._tick_window_errors += 1
                 self.logger.error(
                     "TICK_LOOP_ERROR",
                     error=str(ex),
                 )
 
-            # Heartbeat cada 5 minutos
+            # Heartbeat: chequeo cada 5 min, solo se emite si cambió el
+            # estado del loop o tras 1h de silencio
             now = time.monotonic()
             if (now - self._tick_last_heartbeat) >= self._tick_heartbeat_interval:
-                self.logger.event(
-                    "TICK_LOOP_HEARTBEAT",
-                    ticks_processed=self._tick_count,
-                    errors=self._tick_errors,
-                    cooldown_active=(
-                        (now - self._last_momentum_time) < self._momentum_cooldown_s
-                    ),
-                    last_momentum_side=self._last_momentum_side,
-                )
                 self._tick_last_heartbeat = now
-                self._tick_count = 0
-                self._tick_errors = 0
+                cooldown_active = (
+                    (now - self._last_momentum_time) < self._momentum_cooldown_s
+                )
+                health = (
+                    self._tick_window_errors > 0,
+                    cooldown_active,
+                    self._last_momentum_side,
+                )
+                self._tick_window_errors = 0
+
+                if (
+                    health != self._tick_last_health
+                    or (now - self._tick_last_emit) >= self._tick_heartbeat_max_silence
+                ):
+                    self.logger.event(
+                        "TICK_LOOP_HEARTBEAT",
+                        ticks_processed=self._tick_count,
+                        errors=self._tick_errors,
+                        cooldown_active=cooldown_active,
+                        last_momentum_side=self._last_momentum_side,
+                    )
+                    self._tick_last_health = health
+                    self._tick_last_emit = now
+                    self._tick_count = 0
+                    self._tick_errors = 0
 
             await asyncio.sleep(self.tick_interval_s)
 
@@ -191,6 +216,7 @@ class AutonomousTrader:
             self.logger.event(
                 "CANDLE_SCAN_NO_SIGNALS",
                 timeframe=self.timeframe,
+                scans_without_signal=self.analyzer.scans_without_signal,
             )
             return
 
@@ -230,7 +256,7 @@ class AutonomousTrader:
             return
 
         # Obtener velas M1 recientes (30 velas = 30 minutos)
-        df = self._momentum_data.get_candles(timeframe="M1", count=30)
+        df = self._momentum_data.get_candles(count=30)
         if df is None or len(df) == 0:
             return
 
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+from contextlib import suppress
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -43,7 +44,7 @@ except ImportError as e:
     print(f"Error importando estrategias: {e}")
 
 try:
-    from market.indicators import support_resistance_levels
+    from market.indicators import closest_level, support_resistance_levels
 except ImportError:
     support_resistance_levels = None
 
@@ -187,12 +188,10 @@ def _attach_ml_features(trade: BacktestTrade, window: pd.DataFrame, side: str, *
     """Adjunta features ML al trade si ML está habilitado."""
     if not ML_ENABLED:
         return
-    try:
+    with suppress(Exception):
         features = extract_features(df=window, signal_side=side, **kwargs)
         for key, value in features.items():
             setattr(trade, key, value)
-    except Exception:
-        pass
 
 
 def _get_sr_level(window: pd.DataFrame, current_price: float) -> Optional[float]:
@@ -201,7 +200,7 @@ def _get_sr_level(window: pd.DataFrame, current_price: float) -> Optional[float]
         return None
     try:
         levels = support_resistance_levels(window, lookback=20)
-        return min(levels, key=lambda l: abs(l - current_price)) if levels else None
+        return closest_level(levels, current_price)
     except Exception:
         return None
 
@@ -351,6 +350,11 @@ def run_backtest(
         trend_strategy = _build_trend_strategy(session_filter, ema_filter)
         print("TrendStrategy lista")
 
+    # Sesiones precalculadas para todo el histórico: las velas fuera de
+    # sesión no generan señal, así que ni se recorta la ventana
+    reversal_active = reversal_strategy.session_mask(df_h1.index) if reversal_strategy else None
+    trend_active = trend_strategy.session_mask(df_h1.index) if trend_strategy else None
+
     # Loop principal
     for i in range(len(df_h1)):
         if i - last_trade_i < cooldown_bars:
@@ -360,7 +364,7 @@ def run_backtest(
         strategy_name = None
 
         # --- REVERSAL ---
-        if reversal_strategy and i >= 30:
+        if reversal_strategy and i >= 30 and reversal_active[i]:
             window = df_h1.iloc[max(0, i - 250):i + 1].copy()
             current_price = float(window["close"].iloc[-1])
             ts = window.index[-1]
@@ -378,7 +382,7 @@ def run_backtest(
                                         sr_level=sr_level)
 
         # --- TREND ---
-        if trade is None and trend_strategy and i >= 55:
+        if trade is None and trend_strategy and i >= 55 and trend_active[i]:
             window = df_h1.iloc[max(0, i - 100):i + 1].copy()
             current_price = float(window["close"].iloc[-1])
             ts = window.index[-1]
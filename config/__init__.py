@@ -31,6 +31,7 @@ from .settings import (
     SL_DISTANCE,
     TP_DISTANCES,
     SESSION_FILTER,
+    STRATEGIES,
 )
 
 from .constants import (
@@ -62,7 +63,7 @@ __all__ = [
     "HARD_DRIFT", "MAX_SPLITS", "PENDING_TIMEOUT_MIN",
     "BUY_UP_TOL", "BUY_DOWN_TOL", "SELL_DOWN_TOL", "SELL_UP_TOL",
     "EXTRA_SLIPPAGE", "BE_BUFFER", "MAX_OPEN_POSITIONS", "SCAN_INTERVAL",
-    "SL_DISTANCE", "TP_DISTANCES", "SESSION_FILTER",
+    "SL_DISTANCE", "TP_DISTANCES", "SESSION_FILTER", "STRATEGIES",
     "MT5_RETCODE_SUCCESS", "MT5_RETCODE_INVALID_FILL",
     "COMMENT_MARKET_ORDER", "COMMENT_PENDING_ORDER",
     "COMMENT_CLOSE_ORDER", "COMMENT_MODIFY_BE", "COMMENT_MODIFY_SLTP",
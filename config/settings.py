@@ -7,14 +7,14 @@ from typing import Optional
 import os
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MT5Config:
     login: int
     password: str
     server: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradingConfig:
     symbol: str
     volume_per_order: float
@@ -34,9 +34,10 @@ class TradingConfig:
     sl_distance: float = 6.0
     tp_distances: tuple = (5.0, 11.0, 16.0)
     session_filter: str = "eu_ny"
+    strategies: tuple = ("REVERSAL", "TREND")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     use_real_account: bool
     dry_run: bool
@@ -73,6 +74,7 @@ def _create_demo_trading_config() -> TradingConfig:
         sl_distance=6.0,
         tp_distances=(5.0, 11.0, 16.0),
         session_filter="eu_ny",
+        strategies=("REVERSAL", "TREND"),
     )
 
 
@@ -96,6 +98,7 @@ def _create_real_trading_config() -> TradingConfig:
         sl_distance=6.0,
         tp_distances=(5.0, 11.0, 16.0),
         session_filter="eu_ny",
+        strategies=("REVERSAL", "TREND"),
     )
 
 
@@ -149,4 +152,5 @@ MAX_OPEN_POSITIONS = CONFIG.trading.max_open_positions
 SCAN_INTERVAL = CONFIG.trading.scan_interval
 SL_DISTANCE = CONFIG.trading.sl_distance
 TP_DISTANCES = CONFIG.trading.tp_distances
-SESSION_FILTER = CONFIG.trading.session_filter
\ No newline at end of file
+SESSION_FILTER = CONFIG.trading.session_filter
+STRATEGIES = CONFIG.trading.strategies
\ No newline at end of file
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import config as CFG
 
@@ -12,17 +12,17 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     message_id: int
     symbol: str
     side: str
     entry: float
-    tps: List[float]
+    tps: Sequence[float]
     sl: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SplitState:
     split_index: int
     side: str
@@ -52,7 +52,7 @@ class SplitState:
     sl_move_applied_ts: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalState:
     signal: Signal
     splits: List[SplitState] = field(default_factory=list)
@@ -1,6 +1,7 @@
 # infrastructure/logging/__init__.py
 from .logger import (
     BotLogger,
+    format_traceback,
     get_logger,
     set_logger,
     event,
@@ -12,6 +13,7 @@ from .logger import (
 
 __all__ = [
     "BotLogger",
+    "format_traceback",
     "get_logger",
     "set_logger",
     "event",
@@ -1,21 +1,81 @@
 # infrastructure/logging/logger.py
+import atexit
 import json
 import os
+import sys
 import threading
+import time
+import traceback
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson es opcional
+    orjson = None
+
+_ORJSON_OPTS = (
+    orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if orjson is not None else 0
+)
+
+
+def _dumps_line(event: Dict[str, Any]) -> bytes:
+    """
+    Serializa un evento como una línea JSONL en bytes.
+
+    Usa orjson si está instalado; si no (o si orjson no puede con algún
+    valor, p.ej. enteros de más de 64 bits) cae a json de la stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(event, default=str, option=_ORJSON_OPTS)
+        except TypeError:
+            pass
+    return (json.dumps(event, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def format_traceback(exc_info: Union[bool, BaseException]) -> str:
+    """
+    Formatea el traceback de una excepción.
+
+    Con una instancia se formatea directamente desde su __traceback__;
+    con True se usa la excepción que se está manejando.
+    """
+    if isinstance(exc_info, BaseException):
+        return "".join(traceback.format_exception(exc_info))
+    return traceback.format_exc()
 
 
 class BotLogger:
     """
     Logger centralizado que escribe eventos en formato JSONL.
     Thread-safe y con manejo de errores robusto.
+
+    Las líneas se acumulan en un buffer y se escriben en bloque cada
+    `flush_every` eventos o `flush_interval` segundos (hilo daemon),
+    así el tick loop no paga un open/write por evento. Los ERROR se
+    escriben al momento y el buffer se vacía al salir del proceso.
     """
 
-    def __init__(self, log_path: str = "bot_events.jsonl"):
+    def __init__(
+        self,
+        log_path: str = "bot_events.jsonl",
+        flush_every: int = 64,
+        flush_interval: float = 0.05,
+        traceback_interval: float = 10.0,
+    ):
         self.log_path = log_path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
         self._lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._pending = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self.traceback_interval = traceback_interval
+        self._traceback_last: Dict[Any, float] = {}
         self._ensure_log_dir()
+        atexit.register(self.flush)
 
     def _ensure_log_dir(self) -> None:
         log_dir = os.path.dirname(os.path.abspath(self.log_path))
@@ -33,41 +93,86 @@ class BotLogger:
         try:
             if "ts" not in event:
                 event["ts"] = self._utc_now()
-            line = json.dumps(event, ensure_ascii=False, default=str)
-            with self._lock:
-                with open(self.log_path, "a", encoding="utf-8") as f:
-                    f.write(line + "\n")
+            line = _dumps_line(event)
         except Exception as e:
-            import sys
             print(f"[LOGGER ERROR] {e}: {event}", file=sys.stderr)
+            return
+
+        with self._lock:
+            self._buffer.append(line)
+            pending = len(self._buffer)
+
+        if pending >= self.flush_every or event.get("level") == "ERROR":
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def flush(self) -> None:
+        """Escribe en disco los eventos pendientes del buffer."""
+        with self._lock:
+            if not self._buffer:
+                return
+            data = b"".join(self._buffer)
+            self._buffer.clear()
+            try:
+                with open(self.log_path, "ab") as f:
+                    f.write(data)
+            except Exception as e:
+                print(f"[LOGGER ERROR] {e}: {len(data)} bytes perdidos", file=sys.stderr)
+
+    def _schedule_flush(self) -> None:
+        self._pending.set()
+        if self._flusher is None:
+            with self._lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop,
+                        name="bot-logger-flush",
+                        daemon=True,
+                    )
+                    self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            self._pending.wait()
+            time.sleep(self.flush_interval)
+            self._pending.clear()
+            self.flush()
 
     def event(self, event_type: str, **data: Any) -> None:
-        e = {"event": event_type}
-        e.update(data)
-        self._write_event(e)
+        self._write_event({"event": event_type, **data})
 
     def info(self, message: str, **context: Any) -> None:
-        e = {"event": "INFO", "level": "INFO", "message": message}
-        e.update(context)
-        self._write_event(e)
+        self._write_event({"event": "INFO", "level": "INFO", "message": message, **context})
 
     def warning(self, message: str, **context: Any) -> None:
-        e = {"event": "WARNING", "level": "WARNING", "message": message}
-        e.update(context)
-        self._write_event(e)
+        self._write_event({"event": "WARNING", "level": "WARNING", "message": message, **context})
 
-    def error(self, message: str, exc_info: bool = False, **context: Any) -> None:
+    def error(self, message: str, exc_info: Union[bool, BaseException] = False, **context: Any) -> None:
         e = {"event": "ERROR", "level": "ERROR", "message": message}
         if exc_info:
-            import traceback
-            e["traceback"] = traceback.format_exc()
+            exc_type = type(exc_info) if isinstance(exc_info, BaseException) else sys.exc_info()[0]
+            e["exc_type"] = getattr(exc_type, "__name__", None)
+            if self._should_capture_traceback(exc_type):
+                e["traceback"] = format_traceback(exc_info)
         e.update(context)
         self._write_event(e)
 
+    def _should_capture_traceback(self, exc_type: Any) -> bool:
+        """
+        Como máximo un traceback completo por tipo de excepción cada
+        `traceback_interval` segundos: un error que se repite en bucle
+        (p.ej. MT5 desconectado) no formatea el stack en cada evento.
+        """
+        now = time.monotonic()
+        last = self._traceback_last.get(exc_type)
+        if last is not None and (now - last) < self.traceback_interval:
+            return False
+        self._traceback_last[exc_type] = now
+        return True
+
     def debug(self, message: str, **context: Any) -> None:
-        e = {"event": "DEBUG", "level": "DEBUG", "message": message}
-        e.update(context)
-        self._write_event(e)
+        self._write_event({"event": "DEBUG", "level": "DEBUG", "message": message, **context})
 
 
 _logger: Optional[BotLogger] = None
@@ -101,7 +206,7 @@ def warning(message: str, **context: Any) -> None:
     get_logger().warning(message, **context)
 
 
-def error(message: str, exc_info: bool = False, **context: Any) -> None:
+def error(message: str, exc_info: Union[bool, BaseException] = False, **context: Any) -> None:
     get_logger().error(message, exc_info=exc_info, **context)
 
 
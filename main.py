@@ -13,63 +13,78 @@ Uso:
     python main.py
 """
 import asyncio
-import traceback
+import signal
+import sys
 
 import config as CFG
 from adapters.mt5 import MT5Client
-from autonomous.trader import AutonomousTrader
-from autonomous.executor import set_mt5_client
 from core.state import BOT_STATE
-from infrastructure.logging import get_logger
+from infrastructure.logging import format_traceback, get_logger
 
+logger = get_logger()
 
-async def main():
-    logger = get_logger()
-    logger.event("BOOT_AUTONOMOUS")
 
-    print("=" * 70)
-    print("  TRADING BOT - MODO AUTONOMO")
-    print("=" * 70)
-    print(f"  Symbol    : {CFG.SYMBOL}")
-    print(f"  Timeframe : H1 (candle loop) + M1 (tick loop)")
-    print(f"  Strategies: Reversal, Trend, Momentum")
-    print("=" * 70)
+async def main():
+    cfg = CFG.get_config()
+    strategies = [*cfg.trading.strategies, "MOMENTUM"]
+    logger.event(
+        "BOOT_AUTONOMOUS",
+        symbol=cfg.trading.symbol,
+        timeframes=["H1", "M1"],
+        strategies=strategies,
+    )
 
-    print("\nConectando a MT5...")
+    _print_block(
+        "=" * 70,
+        "  TRADING BOT - MODO AUTONOMO",
+        "=" * 70,
+        f"  Symbol    : {cfg.trading.symbol}",
+        f"  Timeframe : H1 (candle loop) + M1 (tick loop)",
+        f"  Strategies: {', '.join(s.title() for s in strategies)}",
+        "=" * 70,
+        "\nConectando a MT5...",
+    )
 
     mt5_client = MT5Client(
-        login=CFG.MT5_LOGIN,
-        password=CFG.MT5_PASSWORD,
-        server=CFG.MT5_SERVER,
-        symbol=CFG.SYMBOL,
-        deviation=CFG.DEVIATION,
-        magic=CFG.MAGIC,
-        dry_run=CFG.DRY_RUN,
+        login=cfg.mt5.login,
+        password=cfg.mt5.password,
+        server=cfg.mt5.server,
+        symbol=cfg.trading.symbol,
+        deviation=cfg.trading.deviation,
+        magic=cfg.trading.magic,
+        dry_run=cfg.dry_run,
     )
 
-    if not mt5_client.connect():
-        print(f"Error: No se pudo conectar a MT5")
-        print(f"  Login : {CFG.MT5_LOGIN}")
-        print(f"  Server: {CFG.MT5_SERVER}")
-        logger.event("MT5_INIT_FAILED", login=CFG.MT5_LOGIN, server=CFG.MT5_SERVER)
+    try:
+        async with mt5_client:
+            await _run_trader(mt5_client, cfg)
+    except ConnectionError:
+        _print_block(
+            "Error: No se pudo conectar a MT5",
+            f"  Login : {cfg.mt5.login}",
+            f"  Server: {cfg.mt5.server}",
+        )
+        logger.event("MT5_INIT_FAILED", login=cfg.mt5.login, server=cfg.mt5.server)
         return
 
-    print(f"MT5 conectado")
-    print(f"  Login : {CFG.MT5_LOGIN}")
-    print(f"  Server: {CFG.MT5_SERVER}")
-    print(f"  Symbol: {CFG.SYMBOL}")
+    print("Bot detenido")
+    logger.event("SHUTDOWN_COMPLETE")
 
-    logger.event("MT5_READY", login=CFG.MT5_LOGIN, server=CFG.MT5_SERVER)
 
-    set_mt5_client(mt5_client)
+async def _run_trader(mt5_client: MT5Client, cfg: CFG.AppConfig) -> None:
+    """Arranca el AutonomousTrader sobre un MT5Client ya conectado."""
+    # Import diferido: autonomous arrastra pandas y las estrategias, que no
+    # hacen falta si la conexion a MT5 falla.
+    from autonomous.executor import set_mt5_client
+    from autonomous.trader import AutonomousTrader
+
+    logger.event("MT5_READY", login=cfg.mt5.login, server=cfg.mt5.server)
 
-    print(f"\nIniciando Autonomous Trader...")
-    print(f"  Candle Loop: Cada {CFG.SCAN_INTERVAL}s")
-    print(f"  Tick Loop  : Cada 100ms")
+    set_mt5_client(mt5_client)
 
     trader = AutonomousTrader(
         state=BOT_STATE,
-        scan_interval=CFG.SCAN_INTERVAL,
+        scan_interval=cfg.trading.scan_interval,
         timeframe="H1",
         candles=100,
         tick_interval_ms=100,
@@ -77,15 +92,26 @@ async def main():
 
     logger.event("AUTONOMOUS_TRADER_INIT")
 
-    print("\nBot autonomo iniciado")
-    print("\n" + "=" * 70)
-    print("  BOT OPERANDO - Presiona Ctrl+C para detener")
-    print("=" * 70)
+    _print_block(
+        "MT5 conectado",
+        f"  Login : {cfg.mt5.login}",
+        f"  Server: {cfg.mt5.server}",
+        f"  Symbol: {cfg.trading.symbol}",
+        "\nIniciando Autonomous Trader...",
+        f"  Candle Loop: Cada {cfg.trading.scan_interval}s",
+        "  Tick Loop  : Cada 100ms",
+        "\nBot autonomo iniciado",
+        "\n" + "=" * 70,
+        "  BOT OPERANDO - Presiona Ctrl+C para detener",
+        "=" * 70,
+    )
+
+    _install_signal_handlers(asyncio.current_task())
 
     try:
         await trader.run()
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\nDeteniendo bot...")
         logger.event("SHUTDOWN_REQUESTED")
 
@@ -94,18 +120,59 @@ async def main():
         logger.event(
             "AUTONOMOUS_ERROR",
             error=str(ex),
-            traceback=traceback.format_exc(),
+            traceback=format_traceback(ex),
         )
 
     finally:
         print("Desconectando MT5...")
-        mt5_client.disconnect()
-        print("Bot detenido")
-        logger.event("SHUTDOWN_COMPLETE")
+
+
+def _print_block(*lines: str) -> None:
+    """Escribe un bloque de consola en una sola llamada a stdout."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _install_signal_handlers(task: asyncio.Task) -> None:
+    """
+    SIGINT/SIGTERM cancelan la tarea principal en lugar de lanzar
+    KeyboardInterrupt, asi los loops del trader se cancelan limpiamente
+    y el async with de main() desconecta MT5.
+
+    En Windows el loop no soporta signal handlers: se mantiene el
+    comportamiento por defecto (KeyboardInterrupt).
+    """
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _request_shutdown, task)
+        except (NotImplementedError, RuntimeError):
+            return
+
+
+def _request_shutdown(task: asyncio.Task) -> None:
+    if not task.done() and not task.cancelling():
+        task.cancel()
+
+
+def _loop_factory():
+    """uvloop como event loop si esta instalado (no existe en Windows)."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 if __name__ == "__main__":
+    # debug=False explicito: PYTHONASYNCIODEBUG / -X dev no activan el
+    # modo debug de asyncio (tracking de corutinas) en produccion.
     try:
-        asyncio.run(main())
+        with asyncio.Runner(debug=False, loop_factory=_loop_factory()) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         print("\nAdios!")
+    finally:
+        logger.flush()
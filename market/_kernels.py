@@ -0,0 +1,93 @@
+# market/_kernels.py
+"""
+Versiones "último valor" de los indicadores de market.indicators.
+
+Las estrategias solo miran el valor de la vela actual; calcular la serie
+rolling completa con pandas para quedarse con .iloc[-1] es trabajo
+desperdiciado. Estas funciones operan sobre arrays numpy y solo tocan
+la ventana final.
+
+Mismos criterios que las versiones pandas (NaN / 50 sin datos
+suficientes); los valores pueden diferir en el último bit porque pandas
+acumula sumas móviles sobre toda la serie.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from math import isnan
+
+import numpy as np
+
+
+def sma_last(values: np.ndarray, period: int) -> float:
+    """Último valor de sma(); NaN si hay menos de `period` valores."""
+    n = len(values)
+    if period <= 0 or n < period:
+        return float("nan")
+    return float(values[n - period:].mean())
+
+
+@lru_cache(maxsize=32)
+def _ema_weights(period: int, n: int) -> np.ndarray:
+    """
+    Pesos de la EMA (adjust=False) sobre n valores, del más antiguo al más
+    reciente: y = (1-a)^(n-1)·x0 + Σ a·(1-a)^(n-1-i)·xi.
+    """
+    alpha = 2.0 / (period + 1)
+    w = (1.0 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    w[1:] *= alpha
+    w.setflags(write=False)
+    return w
+
+
+def ema_last(values: np.ndarray, period: int) -> float:
+    """
+    Último valor de ema(): la recurrencia completa resuelta como un
+    producto escalar con pesos geométricos precalculados por (period, n).
+    NaN si no hay valores.
+    """
+    n = len(values)
+    if period <= 0 or n == 0:
+        return float("nan")
+    return float(_ema_weights(period, n) @ values)
+
+
+def rsi_last(close: np.ndarray, period: int = 14) -> float:
+    """
+    Último valor de rsi() (medias simples de ganancias/pérdidas).
+
+    50 si no hay period + 1 cierres o si no hubo pérdidas en la ventana,
+    igual que el fillna(50) de la versión pandas.
+    """
+    n = len(close)
+    if period <= 0 or n < period + 1:
+        return 50.0
+
+    delta = np.diff(close[n - period - 1:])
+    avg_gain = np.maximum(delta, 0.0).mean()
+    avg_loss = -np.minimum(delta, 0.0).mean()
+
+    if avg_loss == 0 or isnan(avg_loss) or isnan(avg_gain):
+        return 50.0
+
+    rs = avg_gain / avg_loss
+    return float(100 - (100 / (1 + rs)))
+
+
+def atr_last(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> float:
+    """Último valor de atr(); NaN si hay menos de `period` velas."""
+    n = len(close)
+    if period <= 0 or n < period:
+        return float("nan")
+
+    # Solo las últimas `period` velas; la primera vela de la serie no
+    # tiene cierre previo y su TR es high - low
+    start = n - period
+    h = high[start:]
+    l = low[start:]
+    if start > 0:
+        prev_close = close[start - 1:n - 1]
+    else:
+        prev_close = np.concatenate(([np.nan], close[:n - 1]))
+    tr = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+    return float(tr.mean())
@@ -1,30 +1,53 @@
 # market/analyzer.py
 from __future__ import annotations
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
 
 import config as CFG
 from core.state import Signal
 from infrastructure.logging import get_logger
 
+from . import strategies as _strategies
 from .data_provider import DataProvider
-from .strategies import ReversalStrategy, TrendStrategy
+from .snapshot import MarketSnapshot
+
+# Estrategias del candle loop seleccionables por nombre (CFG.STRATEGIES).
+# Se resuelven por nombre de clase para importar solo las configuradas
+STRATEGY_CLASSES = {
+    "REVERSAL": "ReversalStrategy",
+    "TREND": "TrendStrategy",
+}
 
 
 class MarketAnalyzer:
     """
     Orquestador del analisis de mercado autonomo.
 
-    Ejecuta Reversal y Trend sobre datos H1 y devuelve señales.
+    Ejecuta las estrategias de CFG.STRATEGIES (por defecto Reversal y
+    Trend) sobre datos H1 y devuelve señales.
     Breakout descartado tras backtest (4.4% win rate, -$609 en 6 meses).
     """
 
+    __slots__ = (
+        "symbol",
+        "magic",
+        "timeframe",
+        "candles",
+        "logger",
+        "data_provider",
+        "strategies",
+        "scans_without_signal",
+        "_pool",
+    )
+
     def __init__(
         self,
         symbol: Optional[str] = None,
         magic: Optional[int] = None,
         timeframe: str = "H1",
         candles: int = 100,
+        strategies: Optional[Sequence[str]] = None,
     ):
         self.symbol = symbol or str(CFG.SYMBOL)
         self.magic = magic or int(CFG.MAGIC)
@@ -32,12 +55,28 @@ class MarketAnalyzer:
         self.candles = candles
         self.logger = get_logger()
 
-        self.data_provider = DataProvider(self.symbol)
-
-        self.strategies = [
-            ReversalStrategy(symbol=self.symbol, magic=self.magic),
-            TrendStrategy(symbol=self.symbol, magic=self.magic),
-        ]
+        self.data_provider = DataProvider(self.symbol, self.timeframe)
+        self.scans_without_signal = 0
+
+        self.strategies = []
+        for name in strategies or getattr(CFG, "STRATEGIES", ("REVERSAL", "TREND")):
+            cls_name = STRATEGY_CLASSES.get(str(name).upper())
+            if cls_name is None:
+                self.logger.warning(
+                    "Estrategia desconocida",
+                    strategy=name,
+                    valid=list(STRATEGY_CLASSES),
+                )
+                continue
+            cls = getattr(_strategies, cls_name)
+            self.strategies.append(cls(symbol=self.symbol, magic=self.magic))
+
+        # Las estrategias son independientes y solo leen el DataFrame:
+        # se evalúan en paralelo (numpy/pandas sueltan el GIL)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, len(self.strategies)),
+            thread_name_prefix="strategy",
+        )
 
         self.logger.event(
             "MARKET_ANALYZER_INIT",
@@ -57,12 +96,28 @@ class MarketAnalyzer:
             self.logger.event("MARKET_ANALYZER_NO_DATA", symbol=self.symbol)
             return []
 
-        price = current_price or float(df["close"].iloc[-1])
+        # Los horarios de sesión se evalúan sobre la vela (hora del
+        # servidor MT5), por eso el chequeo va después del fetch
+        ts = df.index[-1]
+        active = [s for s in self.strategies if s.is_active(ts)]
+        if not active:
+            self.logger.event("MARKET_SCAN_OUT_OF_SESSION", symbol=self.symbol, bar=str(ts))
+            return []
+
+        # Una sola conversión DataFrame → numpy para todas las estrategias
+        snap = MarketSnapshot.from_df(df)
+        price = current_price or float(snap.close[-1])
         signals: List[Signal] = []
 
-        for strategy in self.strategies:
+        if len(active) == 1:
+            scans = [(active[0], None)]
+        else:
+            scans = [(s, self._pool.submit(s.scan, df, price, snap)) for s in active]
+
+        # Resultados en el orden de self.strategies, no de finalización
+        for strategy, future in scans:
             try:
-                signal = strategy.scan(df, price)
+                signal = future.result() if future else strategy.scan(df, price, snap)
                 if signal:
                     self.logger.event(
                         "SIGNAL_GENERATED",
@@ -80,7 +135,9 @@ class MarketAnalyzer:
                     error=str(ex),
                 )
 
+        # El caso sin señales es la inmensa mayoría de scans y el trader ya
+        # emite CANDLE_SCAN_NO_SIGNALS: aquí solo se cuenta
         if not signals:
-            self.logger.event("MARKET_ANALYZER_NO_SIGNALS", symbol=self.symbol)
+            self.scans_without_signal += 1
 
         return signals
\ No newline at end of file
@@ -8,13 +8,18 @@ puedan calcular indicadores.
 """
 from __future__ import annotations
 
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
 
 import MetaTrader5 as mt5
+import numpy as np
 import pandas as pd
 
 from infrastructure.logging import get_logger
 
+_FLOAT_COLUMNS = ("open", "high", "low", "close", "tick_volume")
+_EXTRA_COLUMNS = ("spread", "real_volume")
+
 
 class DataProvider:
     """
@@ -25,8 +30,8 @@ class DataProvider:
     Con índice datetime UTC.
     """
 
-    # Timeframes disponibles mapeados a constantes MT5
-    TIMEFRAMES = {
+    # Timeframes disponibles mapeados a constantes MT5 (solo lectura)
+    TIMEFRAMES = MappingProxyType({
         "M1":  mt5.TIMEFRAME_M1,
         "M5":  mt5.TIMEFRAME_M5,
         "M15": mt5.TIMEFRAME_M15,
@@ -34,33 +39,45 @@ class DataProvider:
         "H1":  mt5.TIMEFRAME_H1,
         "H4":  mt5.TIMEFRAME_H4,
         "D1":  mt5.TIMEFRAME_D1,
-    }
+    })
 
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, timeframe: str = "H1"):
         """
         Args:
             symbol: Símbolo a operar (ej: "XAUUSD-ECN")
+            timeframe: Timeframe por defecto de get_candles, resuelto a
+                       su constante MT5 una sola vez
         """
         self.symbol = symbol
         self.logger = get_logger()
+        self._default_name = timeframe
+        self._default_tf = self.TIMEFRAMES[timeframe.upper()]
+
+        # (timeframe MT5, count) → (velas cerradas, time de la vela en formación)
+        self._closed_cache: Dict[Tuple[int, int], Tuple[np.ndarray, int]] = {}
 
     def get_candles(
         self,
-        timeframe: str = "H1",
+        timeframe: Optional[str] = None,
         count: int = 100,
     ) -> Optional[pd.DataFrame]:
         """
         Obtiene las últimas N velas del símbolo.
 
         Args:
-            timeframe: Marco temporal ("M1", "M5", "M15", "M30", "H1", "H4", "D1")
+            timeframe: Marco temporal ("M1", "M5", "M15", "M30", "H1", "H4", "D1");
+                       None usa el timeframe por defecto del provider
             count: Número de velas a obtener (desde la más reciente hacia atrás)
 
         Returns:
             DataFrame con columnas OHLCV e índice datetime UTC,
             o None si falla la obtención.
         """
-        tf = self.TIMEFRAMES.get(timeframe.upper())
+        if timeframe is None or timeframe is self._default_name:
+            timeframe = self._default_name
+            tf = self._default_tf
+        else:
+            tf = self.TIMEFRAMES.get(timeframe.upper())
         if tf is None:
             self.logger.error(
                 "Timeframe inválido",
@@ -70,7 +87,7 @@ class DataProvider:
             return None
 
         try:
-            rates = mt5.copy_rates_from_pos(self.symbol, tf, 0, count)
+            rates = self._fetch_rates(tf, count)
         except Exception as ex:
             self.logger.error(
                 "Error obteniendo velas de MT5",
@@ -89,11 +106,53 @@ class DataProvider:
             )
             return None
 
-        # Convertir a DataFrame
-        df = pd.DataFrame(rates)
+        return self._rates_to_df(rates)
 
-        # Convertir timestamp unix a datetime UTC
-        df["time"] = pd.to_datetime(df["time"], unit="s", utc=True)
-        df.set_index("time", inplace=True)
+    def _fetch_rates(self, tf: int, count: int) -> Optional[np.ndarray]:
+        """
+        Ventana de `count` velas reutilizando las velas ya cerradas.
 
-        return df
\ No newline at end of file
+        Dentro de una misma barra solo cambia la vela en formación: si la
+        que devuelve MT5 sigue siendo la del último fetch, se pide solo
+        esa y se concatena a las cerradas cacheadas. Si abrió una barra
+        nueva (o no hay cache) se pide la ventana completa.
+        """
+        key = (tf, count)
+        cached = self._closed_cache.get(key)
+        if cached is not None:
+            closed, forming_time = cached
+            forming = mt5.copy_rates_from_pos(self.symbol, tf, 0, 1)
+            if forming is not None and len(forming) == 1 and forming["time"][0] == forming_time:
+                return np.concatenate((closed, forming))
+
+        rates = mt5.copy_rates_from_pos(self.symbol, tf, 0, count)
+        if rates is not None and count > 1 and len(rates) > 1:
+            self._closed_cache[key] = (rates[:-1].copy(), rates["time"][-1])
+        else:
+            self._closed_cache.pop(key, None)
+        return rates
+
+    @staticmethod
+    def _rates_to_df(rates: np.ndarray) -> pd.DataFrame:
+        """
+        Convierte el record array de MT5 a DataFrame columna a columna.
+
+        OHLC y tick_volume salen ya como float64 C-contiguos, que es lo
+        que consumen indicadores y filtros; spread y real_volume se
+        dejan con su tipo original.
+        """
+        # Convertir timestamp unix a datetime UTC
+        index = pd.DatetimeIndex(
+            pd.to_datetime(rates["time"], unit="s", utc=True),
+            name="time",
+        )
+
+        columns = {
+            name: np.ascontiguousarray(rates[name], dtype=np.float64)
+            for name in _FLOAT_COLUMNS
+        }
+        for name in _EXTRA_COLUMNS:
+            if name in rates.dtype.names:
+                columns[name] = np.ascontiguousarray(rates[name])
+
+        return pd.DataFrame(columns, index=index, copy=False)
\ No newline at end of file
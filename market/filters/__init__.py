@@ -1,17 +1,26 @@
 # market/filters/__init__.py
+from .zones import Zones
 from .order_blocks import detect_order_blocks, is_near_order_block
 from .fvg import detect_fair_value_gaps, is_near_fvg
-from .session import is_high_quality_session, is_valid_session
+from .session import (
+    is_high_quality_session,
+    is_high_quality_session_np,
+    is_valid_session,
+    is_valid_session_np,
+)
 from .sr_quality import count_level_touches, is_quality_level, has_volume_confirmation
 from .impulse import has_recent_impulse
 
 __all__ = [
+    "Zones",
     "detect_order_blocks",
     "is_near_order_block",
     "detect_fair_value_gaps",
     "is_near_fvg",
     "is_high_quality_session",
     "is_valid_session",
+    "is_high_quality_session_np",
+    "is_valid_session_np",
     "count_level_touches",
     "is_quality_level",
     "has_volume_confirmation",
@@ -7,70 +7,65 @@ no cubre completamente ese rango. Indica zonas de liquidez institucional.
 """
 from __future__ import annotations
 
-from typing import List, Dict
-
-import pandas as pd
+from market.snapshot import Candles, as_snapshot
+from .zones import EMPTY_ZONES, Zones
 
 
 def detect_fair_value_gaps(
-    df: pd.DataFrame,
+    df: Candles,
     min_gap_size: float = 5.0,
     lookback: int = 30,
-) -> List[Dict]:
+) -> Zones:
     """
     Detecta Fair Value Gaps en el DataFrame.
 
     Args:
-        df: DataFrame con OHLCV
+        df: DataFrame con OHLCV o MarketSnapshot
         min_gap_size: Tamano minimo del gap en puntos
         lookback: Velas a analizar
 
     Returns:
-        Lista de dicts con keys: type, high, low
+        Zones con los FVGs bullish y bearish (límites low/high)
     """
     if len(df) < lookback + 2:
-        return []
-
-    fvg_zones = []
-    recent_df = df.tail(lookback)
-
-    for i in range(2, len(recent_df)):
-        c_prev2 = recent_df.iloc[i - 2]
-        c_prev1 = recent_df.iloc[i - 1]
-        c_curr  = recent_df.iloc[i]
-
-        # Bullish FVG: gap entre high de N-2 y low de N
-        gap_low  = float(c_prev2["high"])
-        gap_high = float(c_curr["low"])
-
-        if gap_high > gap_low:
-            if c_prev1["high"] < gap_high and c_prev1["low"] > gap_low:
-                if (gap_high - gap_low) > min_gap_size:
-                    fvg_zones.append({
-                        "type": "BULLISH_FVG",
-                        "high": gap_high,
-                        "low":  gap_low,
-                    })
-
-        # Bearish FVG: gap entre low de N-2 y high de N
-        gap_high_b = float(c_prev2["low"])
-        gap_low_b  = float(c_curr["high"])
-
-        if gap_high_b > gap_low_b:
-            if c_prev1["low"] > gap_low_b and c_prev1["high"] < gap_high_b:
-                if (gap_high_b - gap_low_b) > min_gap_size:
-                    fvg_zones.append({
-                        "type": "BEARISH_FVG",
-                        "high": gap_high_b,
-                        "low":  gap_low_b,
-                    })
-
-    return fvg_zones
+        return EMPTY_ZONES
+
+    snap = as_snapshot(df)
+    start = len(snap) - lookback
+    highs = snap.high[start:]
+    lows = snap.low[start:]
+
+    # Ventanas alineadas de 3 velas: N-2, N-1 y N
+    prev2_high, prev1_high, curr_high = highs[:-2], highs[1:-1], highs[2:]
+    prev2_low, prev1_low, curr_low = lows[:-2], lows[1:-1], lows[2:]
+
+    # Bullish FVG: gap entre high de N-2 y low de N
+    bull = (
+        (curr_low > prev2_high)
+        & (prev1_high < curr_low)
+        & (prev1_low > prev2_high)
+        & ((curr_low - prev2_high) > min_gap_size)
+    )
+
+    # Bearish FVG: gap entre low de N-2 y high de N
+    bear = (
+        (prev2_low > curr_high)
+        & (prev1_low > curr_high)
+        & (prev1_high < prev2_low)
+        & ((prev2_low - curr_high) > min_gap_size)
+    )
+
+    return Zones(
+        bull_low=prev2_high[bull],
+        bull_high=curr_low[bull],
+        bear_low=curr_high[bear],
+        bear_high=prev2_low[bear],
+    )
 
 
 def is_near_fvg(
     price: float,
-    fvg_zones: List[Dict],
+    fvg_zones: Zones,
     side: str,
 ) -> bool:
     """
@@ -78,17 +73,10 @@ def is_near_fvg(
 
     Args:
         price: Precio actual
-        fvg_zones: Lista de FVGs detectados
+        fvg_zones: FVGs detectados
         side: "BUY" o "SELL"
 
     Returns:
         True si el precio esta en un FVG del lado correcto
     """
-    for fvg in fvg_zones:
-        if side == "BUY" and fvg["type"] == "BULLISH_FVG":
-            if fvg["low"] <= price <= fvg["high"]:
-                return True
-        if side == "SELL" and fvg["type"] == "BEARISH_FVG":
-            if fvg["low"] <= price <= fvg["high"]:
-                return True
-    return False
\ No newline at end of file
+    return fvg_zones.contains(price, side)
@@ -7,13 +7,15 @@ indicando movimiento institucional con conviction.
 """
 from __future__ import annotations
 
-import pandas as pd
+from math import isnan
 
-from market.indicators import atr
+import numpy as np
+
+from market.snapshot import Candles, as_snapshot
 
 
 def has_recent_impulse(
-    df: pd.DataFrame,
+    df: Candles,
     side: str,
     impulse_multiplier: float = 1.5,
     atr_period: int = 14,
@@ -23,7 +25,7 @@ def has_recent_impulse(
     Verifica si hubo una vela de impulso reciente en la direccion del trade.
 
     Args:
-        df: DataFrame con OHLCV
+        df: DataFrame con OHLCV o MarketSnapshot
         side: "BUY" o "SELL"
         impulse_multiplier: Multiplicador de ATR para considerar impulso
         atr_period: Periodo para calcular ATR
@@ -33,24 +35,23 @@ def has_recent_impulse(
         True si hay al menos una vela de impulso en la direccion correcta.
         True tambien si no hay datos suficientes (no bloquea el trade).
     """
-    if len(df) < lookback + atr_period:
+    snap = as_snapshot(df)
+    if len(snap) < lookback + atr_period:
         return True
 
-    atr_val = float(atr(df, period=atr_period).iloc[-1])
-    if pd.isna(atr_val) or atr_val <= 0:
+    atr_val = snap.atr_last(atr_period)
+    if isnan(atr_val) or atr_val <= 0:
         return True
 
-    recent_candles = df.tail(lookback)
-
-    for i in range(len(recent_candles)):
-        candle = recent_candles.iloc[i]
-        candle_size = abs(candle["close"] - candle["open"])
-        is_bullish = candle["close"] > candle["open"]
-        is_bearish = candle["close"] < candle["open"]
+    start = len(snap) - lookback
+    opens = snap.open[start:]
+    closes = snap.close[start:]
 
-        if side == "BUY" and is_bullish and candle_size > (impulse_multiplier * atr_val):
-            return True
-        if side == "SELL" and is_bearish and candle_size > (impulse_multiplier * atr_val):
-            return True
+    body = closes - opens
+    threshold = impulse_multiplier * atr_val
 
-    return False
\ No newline at end of file
+    if side == "BUY":
+        return bool(np.any((body > 0) & (body > threshold)))
+    if side == "SELL":
+        return bool(np.any((body < 0) & (-body > threshold)))
+    return False
@@ -4,19 +4,20 @@ Deteccion de Order Blocks institucionales.
 """
 from __future__ import annotations
 
-from typing import List, Dict
+from math import isnan
 
-import pandas as pd
+import numpy as np
 
-from market.indicators import atr
+from market.snapshot import Candles, as_snapshot
+from .zones import EMPTY_ZONES, Zones
 
 
 def detect_order_blocks(
-    df: pd.DataFrame,
+    df: Candles,
     impulse_multiplier: float = 1.5,
     atr_period: int = 14,
     lookback: int = 50,
-) -> List[Dict]:
+) -> Zones:
     """
     Detecta Order Blocks en el DataFrame.
 
@@ -24,54 +25,49 @@ def detect_order_blocks(
     Un OB bearish es una vela alcista previa a una vela bajista de impulso.
 
     Args:
-        df: DataFrame con OHLCV
+        df: DataFrame con OHLCV o MarketSnapshot
         impulse_multiplier: Multiplicador de ATR para considerar impulso
         atr_period: Periodo para calcular ATR
         lookback: Velas a analizar
 
     Returns:
-        Lista de dicts con keys: type, high, low
+        Zones con los OBs bullish y bearish (límites low/high)
     """
-    if len(df) < lookback:
-        return []
-
-    atr_val = float(atr(df, period=atr_period).iloc[-1])
-    if pd.isna(atr_val) or atr_val <= 0:
-        return []
-
-    order_blocks = []
-    recent_df = df.tail(lookback)
-
-    for i in range(1, len(recent_df) - 1):
-        curr = recent_df.iloc[i]
-        prev = recent_df.iloc[i - 1]
-
-        curr_size = abs(curr["close"] - curr["open"])
-        is_bullish = curr["close"] > curr["open"]
-        is_bearish = curr["close"] < curr["open"]
-
-        if is_bullish and curr_size > (impulse_multiplier * atr_val):
-            if prev["close"] < prev["open"]:
-                order_blocks.append({
-                    "type": "BULLISH_OB",
-                    "high": float(prev["high"]),
-                    "low":  float(prev["low"]),
-                })
-
-        if is_bearish and curr_size > (impulse_multiplier * atr_val):
-            if prev["close"] > prev["open"]:
-                order_blocks.append({
-                    "type": "BEARISH_OB",
-                    "high": float(prev["high"]),
-                    "low":  float(prev["low"]),
-                })
-
-    return order_blocks
+    snap = as_snapshot(df)
+    if len(snap) < lookback:
+        return EMPTY_ZONES
+
+    atr_val = snap.atr_last(atr_period)
+    if isnan(atr_val) or atr_val <= 0:
+        return EMPTY_ZONES
+
+    start = len(snap) - lookback
+    opens = snap.open[start:]
+    highs = snap.high[start:]
+    lows = snap.low[start:]
+    closes = snap.close[start:]
+
+    # Vela actual: índices 1..n-2; vela previa: 0..n-3 (la última no se evalúa)
+    curr_open, curr_close = opens[1:-1], closes[1:-1]
+    prev_open, prev_close = opens[:-2], closes[:-2]
+
+    impulse = np.abs(curr_close - curr_open) > (impulse_multiplier * atr_val)
+    bull = impulse & (curr_close > curr_open) & (prev_close < prev_open)
+    bear = impulse & (curr_close < curr_open) & (prev_close > prev_open)
+
+    # El OB es la vela previa (índices 0..n-3)
+    prev_high, prev_low = highs[:-2], lows[:-2]
+    return Zones(
+        bull_low=prev_low[bull],
+        bull_high=prev_high[bull],
+        bear_low=prev_low[bear],
+        bear_high=prev_high[bear],
+    )
 
 
 def is_near_order_block(
     price: float,
-    order_blocks: List[Dict],
+    order_blocks: Zones,
     side: str,
 ) -> bool:
     """
@@ -79,17 +75,10 @@ def is_near_order_block(
 
     Args:
         price: Precio actual
-        order_blocks: Lista de OBs detectados
+        order_blocks: OBs detectados
         side: "BUY" o "SELL"
 
     Returns:
         True si el precio esta en un OB del lado correcto
     """
-    for ob in order_blocks:
-        if side == "BUY" and ob["type"] == "BULLISH_OB":
-            if ob["low"] <= price <= ob["high"]:
-                return True
-        if side == "SELL" and ob["type"] == "BEARISH_OB":
-            if ob["low"] <= price <= ob["high"]:
-                return True
-    return False
\ No newline at end of file
+    return order_blocks.contains(price, side)
@@ -4,6 +4,7 @@ Filtros de sesion de trading.
 """
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
@@ -47,4 +48,55 @@ def is_valid_session(ts: pd.Timestamp, session_filter: str = "24h") -> bool:
     if session_filter == "ny_only":
         return 13 <= hour < 22
 
-    return True
\ No newline at end of file
+    return True
+
+
+def _hours(times) -> np.ndarray:
+    """
+    Hora del día de cada timestamp.
+
+    Con un DatetimeIndex se usa .hour, la hora en la zona del índice, igual
+    que ts.hour en las versiones escalares. Un array datetime64 no tiene
+    zona y se trunca a datetime64[h] en vez de dividir asi8 por una
+    constante: la resolución (ns, us, s) depende de la versión de pandas
+    y de cómo se construyó el índice.
+    """
+    if isinstance(times, pd.DatetimeIndex):
+        return np.asarray(times.hour)
+    return np.asarray(times).astype("datetime64[h]").astype(np.int64) % 24
+
+
+def is_high_quality_session_np(times: np.ndarray) -> np.ndarray:
+    """
+    Versión vectorizada de is_high_quality_session.
+
+    Args:
+        times: Índice de velas (df.index) o array datetime64
+
+    Returns:
+        Máscara booleana con una entrada por vela
+    """
+    hour = _hours(times)
+    return ((hour >= 8) & (hour < 10)) | ((hour >= 13) & (hour < 17))
+
+
+def is_valid_session_np(times: np.ndarray, session_filter: str = "24h") -> np.ndarray:
+    """
+    Versión vectorizada de is_valid_session.
+
+    Args:
+        times: Índice de velas (df.index) o array datetime64
+        session_filter: "24h" | "eu_ny" | "ny_only"
+
+    Returns:
+        Máscara booleana con una entrada por vela
+    """
+    if session_filter == "eu_ny":
+        hour = _hours(times)
+        return (hour >= 8) & (hour < 22)
+
+    if session_filter == "ny_only":
+        hour = _hours(times)
+        return (hour >= 13) & (hour < 22)
+
+    return np.ones(len(times), dtype=bool)
@@ -4,11 +4,13 @@ Calidad de niveles de Soporte/Resistencia y confirmacion de volumen.
 """
 from __future__ import annotations
 
-import pandas as pd
+import numpy as np
+
+from market.snapshot import Candles, as_snapshot
 
 
 def count_level_touches(
-    df: pd.DataFrame,
+    df: Candles,
     level: float,
     lookback: int = 50,
     tolerance: float = 3.0,
@@ -17,7 +19,7 @@ def count_level_touches(
     Cuenta cuantas velas tocaron un nivel S/R.
 
     Args:
-        df: DataFrame con OHLCV
+        df: DataFrame con OHLCV o MarketSnapshot
         level: Nivel de precio a evaluar
         lookback: Velas a revisar
         tolerance: Distancia maxima en puntos para considerar toque
@@ -28,20 +30,17 @@ def count_level_touches(
     if len(df) < lookback:
         lookback = len(df)
 
-    recent_df = df.tail(lookback)
-    touches = 0
-
-    for i in range(len(recent_df)):
-        candle = recent_df.iloc[i]
-        if (abs(candle["low"] - level) < tolerance or
-                abs(candle["high"] - level) < tolerance):
-            touches += 1
+    snap = as_snapshot(df)
+    start = len(snap) - lookback
+    lows = snap.low[start:]
+    highs = snap.high[start:]
 
-    return touches
+    touched = (np.abs(lows - level) < tolerance) | (np.abs(highs - level) < tolerance)
+    return int(np.count_nonzero(touched))
 
 
 def is_quality_level(
-    df: pd.DataFrame,
+    df: Candles,
     level: float,
     min_touches: int = 2,
     lookback: int = 50,
@@ -50,7 +49,7 @@ def is_quality_level(
     Verifica si un nivel S/R tiene suficiente calidad.
 
     Args:
-        df: DataFrame con OHLCV
+        df: DataFrame con OHLCV o MarketSnapshot
         level: Nivel a evaluar
         min_touches: Minimo de toques requeridos
         lookback: Velas a revisar
@@ -63,7 +62,7 @@ def is_quality_level(
 
 
 def has_volume_confirmation(
-    df: pd.DataFrame,
+    df: Candles,
     multiplier: float = 1.3,
     lookback: int = 20,
 ) -> bool:
@@ -71,7 +70,7 @@ def has_volume_confirmation(
     Verifica si el volumen actual es superior al promedio.
 
     Args:
-        df: DataFrame con OHLCV
+        df: DataFrame con OHLCV o MarketSnapshot
         multiplier: Multiplicador sobre el volumen promedio
         lookback: Velas para calcular el promedio
 
@@ -81,7 +80,8 @@ def has_volume_confirmation(
     if len(df) < lookback:
         return True
 
-    current_volume = float(df["tick_volume"].iloc[-1])
-    avg_volume = float(df["tick_volume"].tail(lookback).mean())
+    volume = as_snapshot(df).tick_volume
+    current_volume = volume[-1]
+    avg_volume = volume[len(volume) - lookback:].mean()
 
-    return current_volume >= (avg_volume * multiplier)
\ No newline at end of file
+    return bool(current_volume >= (avg_volume * multiplier))
@@ -0,0 +1,42 @@
+# market/filters/zones.py
+"""
+Contenedor columnar de zonas de precio (Order Blocks, FVGs).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+_EMPTY = np.empty(0, dtype=np.float64)
+_EMPTY.setflags(write=False)
+
+
+@dataclass(frozen=True, slots=True)
+class Zones:
+    """
+    Zonas bullish y bearish como arrays paralelos de límites [low, high].
+
+    Los filtros solo preguntan "¿el precio está dentro de alguna zona del
+    lado X?", así que basta una comparación vectorizada por lado en vez
+    de recorrer una lista de dicts.
+    """
+
+    bull_low: np.ndarray
+    bull_high: np.ndarray
+    bear_low: np.ndarray
+    bear_high: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.bull_low) + len(self.bear_low)
+
+    def contains(self, price: float, side: str) -> bool:
+        """True si el precio está dentro de una zona del lado del trade."""
+        if side == "BUY":
+            return bool(np.any((self.bull_low <= price) & (price <= self.bull_high)))
+        if side == "SELL":
+            return bool(np.any((self.bear_low <= price) & (price <= self.bear_high)))
+        return False
+
+
+EMPTY_ZONES = Zones(_EMPTY, _EMPTY, _EMPTY, _EMPTY)
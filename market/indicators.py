@@ -7,14 +7,20 @@ valores calculados. Sin estado, sin efectos secundarios.
 
 El DataFrame de entrada debe tener columnas: open, high, low, close
 con índice datetime (formato estándar de DataProvider).
+
+Las estrategias usan las versiones "último valor" de market._kernels
+(sma_last, ema_last, rsi_last, atr_last), que operan sobre arrays numpy.
 """
 from __future__ import annotations
 
-from typing import List
+from bisect import bisect_left
+from typing import List, Optional
 
 import numpy as np
 import pandas as pd
 
+from market.snapshot import Candles, as_snapshot
+
 
 def sma(df: pd.DataFrame, period: int, column: str = "close") -> pd.Series:
     """
@@ -76,40 +82,48 @@ def rsi(df: pd.DataFrame, period: int = 14, column: str = "close") -> pd.Series:
     return rsi_values.fillna(50)  # Neutral si no hay datos suficientes
 
 
-def recent_high(df: pd.DataFrame, lookback: int) -> float:
+def recent_high(df: Candles, lookback: int) -> float:
     """
     Máximo más alto de las últimas N velas.
 
     Args:
-        df: DataFrame con datos OHLCV
+        df: DataFrame con datos OHLCV o MarketSnapshot
         lookback: Número de velas hacia atrás a considerar
 
     Returns:
         Precio máximo del período
     """
-    if len(df) < lookback:
-        return float(df["high"].max())
-    return float(df["high"].iloc[-lookback:].max())
+    return _window_extreme(as_snapshot(df).high, lookback, np.fmax)
 
 
-def recent_low(df: pd.DataFrame, lookback: int) -> float:
+def recent_low(df: Candles, lookback: int) -> float:
     """
     Mínimo más bajo de las últimas N velas.
 
     Args:
-        df: DataFrame con datos OHLCV
+        df: DataFrame con datos OHLCV o MarketSnapshot
         lookback: Número de velas hacia atrás a considerar
 
     Returns:
         Precio mínimo del período
     """
-    if len(df) < lookback:
-        return float(df["low"].min())
-    return float(df["low"].iloc[-lookback:].min())
+    return _window_extreme(as_snapshot(df).low, lookback, np.fmin)
+
+
+def _window_extreme(values: np.ndarray, lookback: int, ufunc: np.ufunc) -> float:
+    """
+    Reduce las últimas `lookback` velas (todas si hay menos) sobre el
+    slice numpy, sin copiar filas del DataFrame. fmax/fmin ignoran NaN
+    como max()/min() de pandas; NaN si no hay velas.
+    """
+    window = values if len(values) < lookback else values[-lookback:]
+    if len(window) == 0:
+        return float("nan")
+    return float(ufunc.reduce(window))
 
 
 def support_resistance_levels(
-    df: pd.DataFrame,
+    df: Candles,
     lookback: int = 20,
     min_touches: int = 2,
     tolerance_pips: float = 2.0,
@@ -121,7 +135,7 @@ def support_resistance_levels(
     veces dentro de una tolerancia de tolerance_pips.
 
     Args:
-        df: DataFrame con datos OHLCV
+        df: DataFrame con datos OHLCV o MarketSnapshot
         lookback: Velas hacia atrás a analizar
         min_touches: Mínimo de toques para considerar un nivel válido
         tolerance_pips: Tolerancia en pips para agrupar toques
@@ -129,37 +143,94 @@ def support_resistance_levels(
     Returns:
         Lista de niveles ordenados de menor a mayor
     """
-    if len(df) < lookback:
+    snap = as_snapshot(df)
+    if len(snap) < lookback:
         return []
 
-    recent = df.iloc[-lookback:]
+    # Candidatos: highs y lows de cada vela, ordenados
+    candidates = np.sort(np.concatenate((
+        snap.high[-lookback:],
+        snap.low[-lookback:],
+    )))
 
-    # Candidatos: highs y lows de cada vela
-    candidates = list(recent["high"]) + list(recent["low"])
-    candidates.sort()
+    # Ventana de toques de cada candidato: [lefts[i], rights[i])
+    lefts = np.searchsorted(candidates, candidates - tolerance_pips, side="left")
+    rights = np.searchsorted(candidates, candidates + tolerance_pips, side="right")
 
     levels = []
-    used = set()
+    cursor = 0  # los índices < cursor ya pertenecen a un nivel
 
-    for i, price in enumerate(candidates):
-        if i in used:
+    for i in range(len(candidates)):
+        if i < cursor:
             continue
 
-        # Contar cuántos precios están dentro de la tolerancia
-        touches = [
-            j for j, p in enumerate(candidates)
-            if abs(p - price) <= tolerance_pips
-        ]
+        lo, hi = _touch_window(candidates, i, int(lefts[i]), int(rights[i]), tolerance_pips)
 
-        if len(touches) >= min_touches:
+        if hi - lo >= min_touches:
             # El nivel es el promedio de los toques
-            level = float(np.mean([candidates[j] for j in touches]))
-            levels.append(level)
-            used.update(touches)
+            levels.append(float(np.mean(candidates[lo:hi])))
+            cursor = hi
 
     return sorted(levels)
 
 
+def closest_level(levels: List[float], price: float) -> Optional[float]:
+    """
+    Nivel más cercano al precio; None si no hay niveles.
+
+    Requiere levels ordenados (como los devuelve support_resistance_levels):
+    bisect localiza los dos vecinos del precio en vez de recorrer la lista.
+    Ante empate gana el nivel más bajo, igual que min(levels, key=...).
+
+    Args:
+        levels: Niveles ordenados de menor a mayor
+        price: Precio de referencia
+    """
+    if not levels:
+        return None
+
+    i = bisect_left(levels, price)
+    if i == len(levels):
+        i -= 1
+    elif i > 0 and abs(levels[i - 1] - price) <= abs(levels[i] - price):
+        i -= 1
+
+    # Niveles distintos pueden quedar a la misma distancia por redondeo:
+    # min() se queda con el primero
+    best = abs(levels[i] - price)
+    while i > 0 and abs(levels[i - 1] - price) == best:
+        i -= 1
+    return levels[i]
+
+
+def _touch_window(
+    prices: np.ndarray,
+    i: int,
+    lo: int,
+    hi: int,
+    tolerance: float,
+) -> tuple[int, int]:
+    """
+    Ajusta los bordes de searchsorted al criterio exacto abs(p - price) <= tol.
+
+    price ± tol y p - price redondean distinto justo en el borde (p.ej.
+    precios con 2 decimales a exactamente tol de distancia); como el
+    criterio es monótono sobre el array ordenado, basta con mover cada
+    borde como mucho una o dos posiciones.
+    """
+    price = prices[i]
+    n = len(prices)
+    while lo > 0 and abs(prices[lo - 1] - price) <= tolerance:
+        lo -= 1
+    while lo < i and abs(prices[lo] - price) > tolerance:
+        lo += 1
+    while hi < n and abs(prices[hi] - price) <= tolerance:
+        hi += 1
+    while hi > i + 1 and abs(prices[hi - 1] - price) > tolerance:
+        hi -= 1
+    return lo, hi
+
+
 def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     """
     Average True Range — mide la volatilidad del mercado.
@@ -171,14 +242,14 @@ def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     Returns:
         Serie con los valores del ATR
     """
-    high = df["high"]
-    low = df["low"]
-    close = df["close"].shift(1)
+    high = df["high"].to_numpy(dtype=np.float64)
+    low = df["low"].to_numpy(dtype=np.float64)
+    prev_close = np.empty_like(high)
+    prev_close[:1] = np.nan
+    prev_close[1:] = df["close"].to_numpy(dtype=np.float64)[:-1]
 
-    tr = pd.concat([
-        high - low,
-        (high - close).abs(),
-        (low - close).abs(),
-    ], axis=1).max(axis=1)
+    # fmax ignora el NaN del primer cierre previo (TR = high - low),
+    # igual que el max(axis=1) de pandas
+    tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
 
-    return tr.rolling(window=period).mean()
\ No newline at end of file
+    return pd.Series(tr, index=df.index).rolling(window=period).mean()
\ No newline at end of file
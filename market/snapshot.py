@@ -0,0 +1,98 @@
+# market/snapshot.py
+"""
+Snapshot columnar de las velas de un scan.
+
+Los filtros e indicadores trabajan sobre arrays numpy; extraerlos del
+DataFrame una sola vez por scan evita que cada filtro repita la misma
+conversión pandas → numpy.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Union
+
+import numpy as np
+import pandas as pd
+
+from market._kernels import atr_last
+
+
+@dataclass(frozen=True, slots=True)
+class MarketSnapshot:
+    """
+    Columnas OHLCV como arrays float64 C-contiguos, en el orden del
+    DataFrame, y epoch en segundos de la última vela (0 sin velas).
+    """
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    tick_volume: np.ndarray
+    bar_time: int = 0
+    _atr_cache: Dict[int, float] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> MarketSnapshot:
+        """
+        Args:
+            df: DataFrame con columnas open, high, low, close, tick_volume
+                (formato estándar de DataProvider)
+        """
+        return cls(
+            open=_column(df, "open"),
+            high=_column(df, "high"),
+            low=_column(df, "low"),
+            close=_column(df, "close"),
+            tick_volume=_column(df, "tick_volume"),
+            bar_time=_last_epoch(df.index),
+        )
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def atr_last(self, period: int = 14) -> float:
+        """
+        Último valor del ATR (media simple del True Range), cacheado por
+        período: Reversal, order blocks e impulso lo piden sobre las mismas
+        velas en un mismo scan. NaN si no hay `period` velas.
+        """
+        value = self._atr_cache.get(period)
+        if value is None:
+            value = atr_last(self.high, self.low, self.close, period)
+            self._atr_cache[period] = value
+        return value
+
+
+def _column(df: pd.DataFrame, name: str) -> np.ndarray:
+    """
+    Columna como array float64 C-contiguo.
+
+    Se normaliza una vez aquí: si la columna viene de un bloque no
+    contiguo (p.ej. un DataFrame recortado), cada operación numpy
+    posterior haría su propia copia implícita.
+    """
+    return np.ascontiguousarray(df[name].to_numpy(dtype=np.float64))
+
+
+def _last_epoch(index: pd.Index) -> int:
+    """
+    Epoch en segundos de la última vela, leído del array datetime64 sin
+    construir un Timestamp; el cast a [s] no depende de la resolución
+    del índice.
+    """
+    if len(index) == 0:
+        return 0
+    return int(index.values[-1].astype("datetime64[s]").astype(np.int64))
+
+
+Candles = Union[pd.DataFrame, MarketSnapshot]
+
+
+def as_snapshot(data: Candles) -> MarketSnapshot:
+    """Devuelve el snapshot tal cual o lo construye desde un DataFrame."""
+    if isinstance(data, MarketSnapshot):
+        return data
+    return MarketSnapshot.from_df(data)
@@ -1,10 +1,41 @@
 # market/strategies/__init__.py
-from .reversal import ReversalStrategy
-from .trend import TrendStrategy
-from .momentum import MomentumStrategy
+"""
+Estrategias de trading.
+
+Las clases se importan bajo demanda (PEP 562): el proceso solo carga los
+módulos de las estrategias que realmente usa.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .reversal import ReversalStrategy
+    from .trend import TrendStrategy
+    from .momentum import MomentumStrategy
+
+_LAZY = {
+    "ReversalStrategy": "reversal",
+    "TrendStrategy": "trend",
+    "MomentumStrategy": "momentum",
+}
 
 __all__ = [
     "ReversalStrategy",
     "TrendStrategy",
     "MomentumStrategy",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,10 +4,19 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 import config as CFG
 from core.state import Signal
+from market.snapshot import MarketSnapshot
+
+# Franja horaria [desde, hasta) por session_filter; los que no aparecen
+# ("24h" o desconocidos) no filtran
+SESSION_HOURS = {
+    "eu_ny": (8, 22),
+    "ny_only": (13, 22),
+}
 
 
 class BaseStrategy(ABC):
@@ -16,12 +25,28 @@ class BaseStrategy(ABC):
         self.symbol = symbol
         self.magic = magic
 
+        # Config constante durante la vida de la estrategia: se resuelve
+        # una vez aquí y no en cada scan
+        self._sl_distance = float(getattr(CFG, "SL_DISTANCE", 6.0))
+        self._tp_distances = tuple(getattr(CFG, "TP_DISTANCES", (5.0, 11.0, 16.0)))
+        self._session_filter = getattr(CFG, "SESSION_FILTER", "24h")
+        self._session_hours = SESSION_HOURS.get(self._session_filter)
+
     @abstractmethod
     def scan(
         self,
         df: pd.DataFrame,
         current_price: float,
+        snapshot: Optional[MarketSnapshot] = None,
     ) -> Optional[Signal]:
+        """
+        Args:
+            df: Velas OHLCV (formato estándar de DataProvider)
+            current_price: Precio actual
+            snapshot: MarketSnapshot de df ya construido; el MarketAnalyzer
+                      lo comparte entre estrategias para convertir el
+                      DataFrame una sola vez por scan
+        """
         pass
 
     @property
@@ -29,22 +54,35 @@ class BaseStrategy(ABC):
     def name(self) -> str:
         pass
 
-    def _is_valid_session(self, ts: pd.Timestamp) -> bool:
-        """Filtro de sesion desde config. Compartido por todas las estrategias."""
-        session_filter = getattr(CFG, "SESSION_FILTER", "24h")
+    def is_active(self, ts: pd.Timestamp) -> bool:
+        """
+        True si la estrategia puede generar señal en la vela `ts`.
 
-        if session_filter == "24h":
-            return True
+        Lo usa el MarketAnalyzer para no correr estrategias fuera de su
+        sesión; por defecto la estrategia opera siempre.
+        """
+        return True
 
-        hour_utc = ts.hour
+    def session_mask(self, index: pd.DatetimeIndex) -> np.ndarray:
+        """
+        is_active() evaluado sobre todas las velas de un índice a la vez.
 
-        if session_filter == "eu_ny":
-            return 8 <= hour_utc < 22
+        Para loops por vela (backtest): se calcula una vez y se indexa por
+        posición en vez de llamar a is_active en cada barra.
+        """
+        return np.ones(len(index), dtype=bool)
 
-        if session_filter == "ny_only":
-            return 13 <= hour_utc < 22
+    def _is_valid_session(self, ts: pd.Timestamp) -> bool:
+        """Filtro de sesion desde config. Compartido por todas las estrategias."""
+        hours = self._session_hours
+        if hours is None:
+            return True
+        return hours[0] <= ts.hour < hours[1]
 
-        return True
+    @staticmethod
+    def _snapshot(df: pd.DataFrame, snapshot: Optional[MarketSnapshot]) -> MarketSnapshot:
+        """Snapshot recibido o, si no hay, construido desde df."""
+        return snapshot if snapshot is not None else MarketSnapshot.from_df(df)
 
     def _make_signal(
         self,
@@ -54,28 +92,21 @@ class BaseStrategy(ABC):
         tps: list,
         msg_id: int,
     ) -> Optional[Signal]:
-        try:
-            side_u = side.upper()
-
-            if side_u == "BUY":
-                if sl >= entry:
-                    return None
-                if not all(tp > entry for tp in tps):
-                    return None
-            else:
-                if sl <= entry:
-                    return None
-                if not all(tp < entry for tp in tps):
-                    return None
-
-            return Signal(
-                message_id=msg_id,
-                symbol=self.symbol,
-                side=side_u,
-                entry=entry,
-                tps=tps,
-                sl=sl,
-            )
-
-        except Exception:
-            return None
\ No newline at end of file
+        side_u = side.upper()
+
+        # Con el signo del lado, BUY y SELL comparten la misma validación:
+        # SL del lado contrario a la entrada y todos los TPs a favor
+        sign = 1.0 if side_u == "BUY" else -1.0
+        if sign * (entry - sl) <= 0:
+            return None
+        if not all(sign * (tp - entry) > 0 for tp in tps):
+            return None
+
+        return Signal(
+            message_id=msg_id,
+            symbol=self.symbol,
+            side=side_u,
+            entry=entry,
+            tps=tps,
+            sl=sl,
+        )
@@ -25,11 +25,12 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-import config as CFG
 from core.state import Signal
 from market.indicators import atr
+from market.snapshot import MarketSnapshot
 from .base import BaseStrategy
 
 
@@ -65,19 +66,28 @@ class MomentumStrategy(BaseStrategy):
         self.consecutive_candles = consecutive_candles
         self.atr_period = atr_period
 
+        # Velas mínimas para evaluar las 3 condiciones; constante por
+        # instancia, se calcula una vez y no en cada tick (100ms)
+        self._min_candles = max(
+            tick_window,
+            volume_lookback + tick_window,
+            consecutive_candles,
+            atr_period + 1,
+        )
+
     @property
     def name(self) -> str:
         return "MOMENTUM"
 
     def _calculate_tps(self, side: str, entry: float) -> list:
         """TPs fijos desde config."""
-        distances = list(getattr(CFG, "TP_DISTANCES", (5.0, 11.0, 16.0)))
+        distances = self._tp_distances
         if side == "BUY":
             return [round(entry + d, 2) for d in distances]
         else:
             return [round(entry - d, 2) for d in distances]
 
-    def _check_velocity(self, df: pd.DataFrame) -> Optional[str]:
+    def _check_velocity(self, snap: MarketSnapshot) -> Optional[str]:
         """
         Verifica si el precio se movió > move_threshold en tick_window velas.
 
@@ -86,43 +96,43 @@ class MomentumStrategy(BaseStrategy):
             "SELL" si el movimiento es bajista fuerte
             None si no hay momentum suficiente
         """
-        if len(df) < self.tick_window:
+        window = self.tick_window
+        if len(snap) < window:
             return None
 
-        recent = df.iloc[-self.tick_window:]
-        price_start = float(recent.iloc[0]["open"])
-        price_end = float(recent.iloc[-1]["close"])
-        move = price_end - price_start
+        move = float(snap.close[-1] - snap.open[-window])
 
         if abs(move) >= self.move_threshold:
             return "BUY" if move > 0 else "SELL"
 
         return None
 
-    def _check_volume(self, df: pd.DataFrame) -> bool:
+    def _check_volume(self, snap: MarketSnapshot) -> bool:
         """
         Verifica que las últimas tick_window velas tienen volumen explosivo.
 
         El promedio de volumen de las últimas tick_window velas debe superar
         volume_multiplier × el promedio histórico de volume_lookback velas.
         """
-        lookback_total = self.volume_lookback + self.tick_window
-        if len(df) < lookback_total:
+        window = self.tick_window
+        lookback_total = self.volume_lookback + window
+        if len(snap) < lookback_total:
             return False
 
+        volume = snap.tick_volume
+
         # Volumen histórico (baseline)
-        baseline = df.iloc[-(lookback_total):-self.tick_window]["tick_volume"]
-        avg_baseline = float(baseline.mean())
+        avg_baseline = float(volume[-lookback_total:-window].mean())
 
         if avg_baseline <= 0:
             return False
 
         # Volumen reciente
-        recent_vol = float(df.iloc[-self.tick_window:]["tick_volume"].mean())
+        recent_vol = float(volume[-window:].mean())
 
         return recent_vol >= (avg_baseline * self.volume_multiplier)
 
-    def _check_consecutive_candles(self, df: pd.DataFrame) -> Optional[str]:
+    def _check_consecutive_candles(self, snap: MarketSnapshot) -> Optional[str]:
         """
         Verifica que hay consecutive_candles velas del mismo color.
 
@@ -131,53 +141,46 @@ class MomentumStrategy(BaseStrategy):
             "SELL" si son velas bajistas (bear)
             None si la dirección no es clara
         """
-        if len(df) < self.consecutive_candles:
+        count = self.consecutive_candles
+        if len(snap) < count:
             return None
 
-        recent = df.iloc[-self.consecutive_candles:]
-        directions = []
-
-        for _, candle in recent.iterrows():
-            if float(candle["close"]) > float(candle["open"]):
-                directions.append("BUY")
-            elif float(candle["close"]) < float(candle["open"]):
-                directions.append("SELL")
-            else:
-                directions.append("NEUTRAL")
+        body = snap.close[-count:] - snap.open[-count:]
 
-        if all(d == "BUY" for d in directions):
+        if np.all(body > 0):
             return "BUY"
-        if all(d == "SELL" for d in directions):
+        if np.all(body < 0):
             return "SELL"
 
         return None
 
-    def scan(self, df: pd.DataFrame, current_price: float) -> Optional[Signal]:
+    def scan(
+        self,
+        df: pd.DataFrame,
+        current_price: float,
+        snapshot: Optional[MarketSnapshot] = None,
+    ) -> Optional[Signal]:
         """
         Detecta momentum explosivo y genera señal MARKET.
 
         Las 3 condiciones deben cumplirse y apuntar a la misma dirección.
         """
-        min_candles = max(
-            self.tick_window,
-            self.volume_lookback + self.tick_window,
-            self.consecutive_candles,
-            self.atr_period + 1,
-        )
-        if len(df) < min_candles:
+        if len(df) < self._min_candles:
             return None
 
+        snap = self._snapshot(df, snapshot)
+
         # Condición 1: Velocidad
-        velocity_side = self._check_velocity(df)
+        velocity_side = self._check_velocity(snap)
         if velocity_side is None:
             return None
 
         # Condición 2: Volumen explosivo
-        if not self._check_volume(df):
+        if not self._check_volume(snap):
             return None
 
         # Condición 3: Dirección clara (velas consecutivas)
-        candle_side = self._check_consecutive_candles(df)
+        candle_side = self._check_consecutive_candles(snap)
         if candle_side is None:
             return None
 
@@ -186,9 +189,9 @@ class MomentumStrategy(BaseStrategy):
             return None
 
         side = velocity_side
-        sl_distance = float(getattr(CFG, "SL_DISTANCE", 6.0))
+        sl_distance = self._sl_distance
         entry = round(current_price, 2)
-        msg_id = int(df.index[-1].timestamp())
+        msg_id = snap.bar_time
 
         if side == "BUY":
             sl = round(entry - sl_distance, 2)
@@ -24,20 +24,25 @@ Objetivo Supreme: 65-75% WR con 50-150 trades
 """
 from __future__ import annotations
 
+from math import isnan
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 import config as CFG
 from core.state import Signal
 from infrastructure.logging import get_logger
-from market.indicators import support_resistance_levels, rsi, atr, ema
+from market._kernels import ema_last, rsi_last
+from market.indicators import closest_level, support_resistance_levels
+from market.snapshot import MarketSnapshot
 from market.filters import (
     detect_order_blocks,
     is_near_order_block,
     detect_fair_value_gaps,
     is_near_fvg,
     is_high_quality_session,
+    is_high_quality_session_np,
     is_quality_level,
     has_volume_confirmation,
     has_recent_impulse,
@@ -109,6 +114,11 @@ class ReversalStrategy(BaseStrategy):
             self.min_sr_touches = min_sr_touches
             self.use_ml_filter = use_ml_filter
 
+        # Supreme usa sus propios TPs y otro SL por defecto
+        if supreme_mode:
+            self._tp_distances = (11.0, 20.0, 30.0)
+            self._sl_distance = float(getattr(CFG, "SL_DISTANCE", 17.0))
+
         # Hedging
         self.enable_hedging = enable_hedging
         self.max_positions = max_positions
@@ -118,26 +128,38 @@ class ReversalStrategy(BaseStrategy):
         self.ml_confidence_min = ml_confidence_min
         self.open_positions = []
 
+        # Velas mínimas para el scan (200 por la EMA de MTF); constante
+        # por instancia
+        self._min_candles = max(lookback_candles, rsi_period + 1,
+                                atr_period + 1, 200)
+
     @property
     def name(self) -> str:
         return "REVERSAL_SUPREME" if self.supreme_mode else "REVERSAL"
 
+    def is_active(self, ts: pd.Timestamp) -> bool:
+        return not self.enable_strict_session or is_high_quality_session(ts)
+
+    def session_mask(self, index: pd.DatetimeIndex) -> np.ndarray:
+        if not self.enable_strict_session:
+            return super().session_mask(index)
+        return is_high_quality_session_np(index)
+
     def _calculate_tps(self, side: str, entry: float) -> list:
-        distances = (11.0, 20.0, 30.0) if self.supreme_mode else \
-                    tuple(getattr(CFG, "TP_DISTANCES", (5.0, 11.0, 16.0)))
+        distances = self._tp_distances
         if side == "BUY":
             return [round(entry + d, 2) for d in distances]
         return [round(entry - d, 2) for d in distances]
 
-    def _check_mtf_alignment(self, df: pd.DataFrame, side: str) -> bool:
+    def _check_mtf_alignment(self, snap: MarketSnapshot, side: str) -> bool:
         """Verifica alineacion de tendencia H1 via EMA 50 vs 200."""
-        if not self.enable_mtf or len(df) < 200:
+        if not self.enable_mtf or len(snap) < 200:
             return True
 
-        ema_50  = float(ema(df["close"], 50).iloc[-1])
-        ema_200 = float(ema(df["close"], 200).iloc[-1])
+        ema_50  = ema_last(snap.close, 50)
+        ema_200 = ema_last(snap.close, 200)
 
-        if pd.isna(ema_50) or pd.isna(ema_200):
+        if isnan(ema_50) or isnan(ema_200):
             return True
 
         trend_up = ema_50 > ema_200
@@ -151,10 +173,13 @@ class ReversalStrategy(BaseStrategy):
     # SCAN PRINCIPAL
     # ========================================================================
 
-    def scan(self, df: pd.DataFrame, current_price: float) -> Optional[Signal]:
-        min_candles = max(self.lookback_candles, self.rsi_period + 1,
-                          self.atr_period + 1, 200)
-        if len(df) < min_candles:
+    def scan(
+        self,
+        df: pd.DataFrame,
+        current_price: float,
+        snapshot: Optional[MarketSnapshot] = None,
+    ) -> Optional[Signal]:
+        if len(df) < self._min_candles:
             return None
 
         ts = df.index[-1]
@@ -163,33 +188,36 @@ class ReversalStrategy(BaseStrategy):
         if self.enable_strict_session and not is_high_quality_session(ts):
             return None
 
+        # Columnas numpy compartidas por los filtros de este scan
+        snap = self._snapshot(df, snapshot)
+
         # S/R levels
-        levels = support_resistance_levels(df, lookback=self.lookback_candles)
+        levels = support_resistance_levels(snap, lookback=self.lookback_candles)
         if not levels:
             return None
 
-        closest_level = min(levels, key=lambda l: abs(l - current_price))
-        if abs(current_price - closest_level) > self.proximity_pips:
+        level = closest_level(levels, current_price)
+        if abs(current_price - level) > self.proximity_pips:
             return None
 
         # Calidad del nivel S/R
         if self.enable_quality_filter and not is_quality_level(
-            df, closest_level, min_touches=self.min_sr_touches
+            snap, level, min_touches=self.min_sr_touches
         ):
             return None
 
         # Indicadores
-        current_rsi = float(rsi(df, period=self.rsi_period).iloc[-1])
-        atr_value   = float(atr(df, period=self.atr_period).iloc[-1])
+        current_rsi = rsi_last(snap.close, self.rsi_period)
+        atr_value   = snap.atr_last(self.atr_period)
 
-        if pd.isna(atr_value) or atr_value <= 0:
+        if isnan(atr_value) or atr_value <= 0:
             return None
 
         # Detectar lado potencial
         potential_side = None
-        if current_price <= closest_level and current_rsi < self.rsi_oversold:
+        if current_price <= level and current_rsi < self.rsi_oversold:
             potential_side = "BUY"
-        elif current_price >= closest_level and current_rsi > self.rsi_overbought:
+        elif current_price >= level and current_rsi > self.rsi_overbought:
             potential_side = "SELL"
 
         if potential_side is None:
@@ -208,13 +236,13 @@ class ReversalStrategy(BaseStrategy):
 
         if self.supreme_mode or any_advanced:
 
-            if self.enable_mtf and not self._check_mtf_alignment(df, potential_side):
+            if self.enable_mtf and not self._check_mtf_alignment(snap, potential_side):
                 return None
 
             if self.enable_order_blocks or self.enable_fvg:
-                obs  = detect_order_blocks(df, self.impulse_multiplier, self.atr_period) \
+                obs  = detect_order_blocks(snap, self.impulse_multiplier, self.atr_period) \
                        if self.enable_order_blocks else []
-                fvgs = detect_fair_value_gaps(df) \
+                fvgs = detect_fair_value_gaps(snap) \
                        if self.enable_fvg else []
 
                 in_ob  = obs  and is_near_order_block(current_price, obs,  potential_side)
@@ -228,10 +256,9 @@ class ReversalStrategy(BaseStrategy):
         # GENERAR SEÑAL
         # ====================================================================
 
-        msg_id      = int(ts.timestamp())
+        msg_id      = snap.bar_time
         entry       = round(current_price, 2)
-        sl_distance = float(getattr(CFG, "SL_DISTANCE",
-                                    17.0 if self.supreme_mode else 6.0))
+        sl_distance = self._sl_distance
 
         if potential_side == "BUY":
             sl  = round(entry - sl_distance, 2)
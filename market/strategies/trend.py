@@ -15,14 +15,17 @@ Filtros activos:
 """
 from __future__ import annotations
 
+from math import isnan
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-import config as CFG
 from core.state import Signal
 from infrastructure.logging import get_logger
-from market.indicators import sma, atr
+from market._kernels import sma_last
+from market.filters import is_valid_session_np
+from market.snapshot import MarketSnapshot
 from .base import BaseStrategy
 
 logger = get_logger()
@@ -55,54 +58,68 @@ class TrendStrategy(BaseStrategy):
         self.min_atr = min_atr
         self.max_atr = max_atr
 
+        # Velas mínimas para SMA lenta y ATR; constante por instancia
+        self._min_candles = max(slow_period + 1, atr_period + 1)
+
     @property
     def name(self) -> str:
         return "TREND"
 
+    def is_active(self, ts: pd.Timestamp) -> bool:
+        return self._is_valid_session(ts)
+
+    def session_mask(self, index: pd.DatetimeIndex) -> np.ndarray:
+        return is_valid_session_np(index, self._session_filter)
+
     def _calculate_tps(self, side: str, entry: float, tp_distances: tuple = None) -> list:
         if tp_distances is None:
-            tp_distances = tuple(getattr(CFG, "TP_DISTANCES", (5.0, 11.0, 16.0)))
+            tp_distances = self._tp_distances
         if side == "BUY":
             return [round(entry + d, 2) for d in tp_distances]
         else:
             return [round(entry - d, 2) for d in tp_distances]
 
-    def _check_momentum_confirmation(self, df: pd.DataFrame, side: str) -> bool:
+    def _check_momentum_confirmation(self, snap: MarketSnapshot, side: str) -> bool:
         if not self.enable_filters:
             return True
-        if len(df) < self.momentum_periods:
+        n = len(snap)
+        if n < self.momentum_periods:
             return True
 
-        last_candles = df.tail(self.momentum_periods)
+        start = n - self.momentum_periods
+        closes = snap.close[start:]
+        opens = snap.open[start:]
 
         if side == "BUY":
-            bullish_count = (last_candles["close"] > last_candles["open"]).sum()
+            bullish_count = int((closes > opens).sum())
             confirmed = bullish_count >= self.momentum_periods
             if not confirmed:
                 logger.event("TREND_FILTER_REJECTED",
                              filter="momentum", side="BUY",
-                             bullish=int(bullish_count), required=self.momentum_periods)
+                             bullish=bullish_count, required=self.momentum_periods)
             return confirmed
 
         elif side == "SELL":
-            bearish_count = (last_candles["close"] < last_candles["open"]).sum()
+            bearish_count = int((closes < opens).sum())
             confirmed = bearish_count >= self.momentum_periods
             if not confirmed:
                 logger.event("TREND_FILTER_REJECTED",
                              filter="momentum", side="SELL",
-                             bearish=int(bearish_count), required=self.momentum_periods)
+                             bearish=bearish_count, required=self.momentum_periods)
             return confirmed
 
         return False
 
-    def _check_volume_filter(self, df: pd.DataFrame, volume_periods: int = 20) -> bool:
+    def _check_volume_filter(self, snap: MarketSnapshot, volume_periods: int = 20) -> bool:
         if not self.enable_filters:
             return True
-        if len(df) < volume_periods:
+        n = len(snap)
+        if n < volume_periods:
             return True
 
-        avg_volume = df["tick_volume"].tail(volume_periods).mean()
-        current_volume = df["tick_volume"].iloc[-1]
+        volume = snap.tick_volume
+        avg_volume = volume[n - volume_periods:].mean()
+        current_volume = volume[-1]
         threshold = avg_volume * self.volume_multiplier
 
         if current_volume < threshold:
@@ -116,8 +133,8 @@ class TrendStrategy(BaseStrategy):
     def _check_atr_filter(self, atr_value: float) -> Optional[dict]:
         if not self.enable_filters:
             return {
-                "sl": float(getattr(CFG, "SL_DISTANCE", 6.0)),
-                "tp_distances": tuple(getattr(CFG, "TP_DISTANCES", (5.0, 11.0, 16.0))),
+                "sl": self._sl_distance,
+                "tp_distances": self._tp_distances,
             }
 
         BASE_ATR = 15.0
@@ -127,8 +144,8 @@ class TrendStrategy(BaseStrategy):
                          filter="atr", atr=round(atr_value, 2), min=self.min_atr)
             return None
 
-        base_sl = float(getattr(CFG, "SL_DISTANCE", 6.0))
-        base_tps = tuple(getattr(CFG, "TP_DISTANCES", (5.0, 11.0, 16.0)))
+        base_sl = self._sl_distance
+        base_tps = self._tp_distances
 
         if atr_value > self.max_atr:
             multiplier = atr_value / BASE_ATR
@@ -141,33 +158,37 @@ class TrendStrategy(BaseStrategy):
 
         return {"sl": base_sl, "tp_distances": base_tps}
 
-    def scan(self, df: pd.DataFrame, current_price: float) -> Optional[Signal]:
-        min_candles = max(self.slow_period + 1, self.atr_period + 1)
-        if len(df) < min_candles:
+    def scan(
+        self,
+        df: pd.DataFrame,
+        current_price: float,
+        snapshot: Optional[MarketSnapshot] = None,
+    ) -> Optional[Signal]:
+        if len(df) < self._min_candles:
             return None
 
         ts = df.index[-1]
         if not self._is_valid_session(ts):
             return None
 
-        sma_fast = sma(df, self.fast_period)
-        sma_slow = sma(df, self.slow_period)
+        snap = self._snapshot(df, snapshot)
 
-        current_sma_fast = float(sma_fast.iloc[-1])
-        current_sma_slow = float(sma_slow.iloc[-1])
+        current_sma_fast = sma_last(snap.close, self.fast_period)
+        current_sma_slow = sma_last(snap.close, self.slow_period)
 
-        if pd.isna(current_sma_fast) or pd.isna(current_sma_slow):
+        if isnan(current_sma_fast) or isnan(current_sma_slow):
             return None
 
-        atr_series = atr(df, period=self.atr_period)
-        atr_value = float(atr_series.iloc[-1])
-        if pd.isna(atr_value) or atr_value <= 0:
+        # Lo habitual es que el precio no esté tocando la SMA20: se
+        # descarta antes de calcular el ATR
+        if abs(current_price - current_sma_fast) > self.proximity_pips:
             return None
 
-        if abs(current_price - current_sma_fast) > self.proximity_pips:
+        atr_value = snap.atr_last(self.atr_period)
+        if isnan(atr_value) or atr_value <= 0:
             return None
 
-        msg_id = int(df.index[-1].timestamp())
+        msg_id = snap.bar_time
 
         potential_side = None
         if current_sma_fast > current_sma_slow and current_price >= current_sma_fast:
@@ -184,11 +205,11 @@ class TrendStrategy(BaseStrategy):
                      sma20=round(current_sma_fast, 2),
                      sma50=round(current_sma_slow, 2))
 
-        if not self._check_momentum_confirmation(df, potential_side):
+        if not self._check_momentum_confirmation(snap, potential_side):
             logger.event("TREND_TRADE_REJECTED", reason="momentum")
             return None
 
-        if not self._check_volume_filter(df):
+        if not self._check_volume_filter(snap):
             logger.event("TREND_TRADE_REJECTED", reason="volume")
             return None
 